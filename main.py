@@ -1,25 +1,47 @@
 import os
+import atexit
+import functools
 import sys
 import time
-import itertools
 import sqlite3 as sql
 from typing import Literal
 
-import pick
-from termcolor import colored
-from tabulate import tabulate
+# `pick`, `tabulate` and `numba` are imported where they're used for a fast startup
 
+# PyInstaller creates a temp folder and stores path in _MEIPASS
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
 
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Function to get the absolute path to a resource (used for PyInstaller compatibility)"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+    return os.path.join(_BASE_PATH, relative_path)
+
+
+def enable_ansi_escapes():
+    """Turns on ANSI escape sequence processing in the Windows console."""
+    import ctypes
+
+    STD_OUTPUT_HANDLE = -11
+    ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+    mode = ctypes.c_ulong()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return False
+
+    mode = mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    return bool(kernel32.SetConsoleMode(handle, mode))
 
-    return os.path.join(base_path, relative_path)
 
+# Homes the cursor and clears the screen and scrollback, like `cls`/`clear` do
+CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+# Dumb terminals (and consoles without ANSI support) fall back to `cls`/`clear`
+USE_ANSI_CLEAR = os.environ.get("TERM") != "dumb" and (
+    os.name != "nt" or enable_ansi_escapes()
+)
 
 DIVIDER = "\n══════════════════════════════════════════════════════\n"
 
@@ -42,62 +64,215 @@ winning_combos = (
     (3, 5, 7),  # Diagonal
 )
 
+# Bitmask of each winning combination, where cell N maps to bit N - 1
+WIN_MASKS = tuple(sum(1 << (cell - 1) for cell in combo) for combo in winning_combos)
+
+# Valid move inputs mapped to their cell numbers
+MOVE_MAP = {str(cell): cell for cell in range(1, 10)}
+
+# Winning combination for each bitmask, and the bitmask of a filled board
+MASK_TO_COMBO = dict(zip(WIN_MASKS, winning_combos))
+FULL_BOARD = (1 << 9) - 1
+
+
+def winning_mask(bits: int):
+    """Returns the winning combination bitmask covered by bits, or 0 if none."""
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return mask
+
+    return 0
+
+
+def is_full_mask(bits: int):
+    """Returns whether the occupied cells bitmask covers the whole board."""
+    return bits == FULL_BOARD
+
+
+# Numba's on-disk cache has no source file to key on in frozen (PyInstaller) builds
+USE_NUMBA = not getattr(sys, "frozen", False)
+
+# The (winning_mask, is_full_mask) kernels used by the board, set on first use
+_kernels = None
+
+
+def kernels():
+    """Returns the board kernels, compiled with Numba when available."""
+    global _kernels
+
+    if _kernels is None:
+        _kernels = (winning_mask, is_full_mask)
+
+        if USE_NUMBA:
+            try:
+                from numba import njit
+            except ImportError:  # Numba is optional, keep the Python kernels
+                pass
+            else:
+                _kernels = tuple(njit(cache=True)(kernel) for kernel in _kernels)
+
+    return _kernels
+
+
+# Cells tried first by the solver: center, then corners, then edges
+SOLVER_CELL_ORDER = (5, 1, 3, 7, 9, 2, 4, 6, 8)
+
+# Perfect-play tables indexed by (own_bits << 9) | opponent_bits, built on first use.
+# A win scores 10 minus the cells filled when it lands, a loss the negative of that
+# and a draw 0, so quicker wins and slower losses are preferred. _move_scores holds
+# the mover's score plus SCORE_OFFSET (0 marks a position not solved yet), and
+# _move_cells the best cell to play, or 0 once the round is over.
+SCORE_OFFSET = 10
+_move_scores = None
+_move_cells = None
+
+
+def _solve(scores: bytearray, cells: bytearray, own: int, opp: int):
+    """Fills in the tables for a position and returns its score for the mover."""
+    key = own << 9 | opp
+    if scores[key]:
+        return scores[key] - SCORE_OFFSET
+
+    filled = own | opp
+    moves_made = filled.bit_count()
+
+    best_cell = 0
+    if winning_mask(opp):
+        best_score = moves_made - 10
+    elif is_full_mask(filled):
+        best_score = 0
+    else:
+        best_score = -SCORE_OFFSET
+        quickest_win = 10 - (moves_made + 1)
+        for cell in SOLVER_CELL_ORDER:
+            bit = 1 << (cell - 1)
+            if filled & bit:
+                continue
+
+            score = -_solve(scores, cells, opp, own | bit)
+            if score > best_score:
+                best_score, best_cell = score, cell
+
+                if best_score == quickest_win:
+                    break  # Nothing beats winning right away!
+
+    scores[key] = best_score + SCORE_OFFSET
+    cells[key] = best_cell
+    return best_score
 
-def clear_screen():
-    """Clears the terminal screen."""
 
-    os.system("cls" if os.name == "nt" else "clear")
-    print(cyanify(TTT_LOGO))
+def best_move(own_bits: int, opp_bits: int):
+    """Returns the best cell for the player to move, or 0 if the round is over."""
+    global _move_scores, _move_cells
+
+    filled = own_bits | opp_bits
+    if winning_mask(own_bits) or winning_mask(opp_bits) or is_full_mask(filled):
+        return 0
+
+    if _move_scores is None:
+        _move_scores = bytearray(1 << 18)
+        _move_cells = bytearray(1 << 18)
+        _solve(_move_scores, _move_cells, 0, 0)
+
+    key = own_bits << 9 | opp_bits
+    if not _move_scores[key]:
+        _solve(_move_scores, _move_cells, own_bits, opp_bits)
+
+    return _move_cells[key]
+
+
+def clear_screen(text: str = ""):
+    """Clears the terminal screen and draws the logo followed by text in one write."""
+
+    if USE_ANSI_CLEAR:
+        sys.stdout.write(f"{CLEAR_SCREEN}{TTT_LOGO_COLORED}\n{text}")
+    else:
+        sys.stdout.flush()
+        os.system("cls" if os.name == "nt" else "clear")
+        sys.stdout.write(f"{TTT_LOGO_COLORED}\n{text}")
+
+    sys.stdout.flush()
+
+
+# Colors are only used when the output is a terminal, honoring NO_COLOR/FORCE_COLOR
+USE_COLOR = (
+    "ANSI_COLORS_DISABLED" not in os.environ
+    and "NO_COLOR" not in os.environ
+    and ("FORCE_COLOR" in os.environ or sys.stdout.isatty())
+)
+
+# ANSI escape sequences used by the text styling functions below
+RED = "\x1b[31m" if USE_COLOR else ""
+GREEN = "\x1b[32m" if USE_COLOR else ""
+YELLOW = "\x1b[33m" if USE_COLOR else ""
+BLUE = "\x1b[34m" if USE_COLOR else ""
+MAGENTA = "\x1b[35m" if USE_COLOR else ""
+CYAN = "\x1b[36m" if USE_COLOR else ""
+BOLD = "\x1b[1m" if USE_COLOR else ""
+UNDERLINE = "\x1b[4m" if USE_COLOR else ""
+RESET = "\x1b[0m" if USE_COLOR else ""
 
 
 def redify(text: str):
     """Returns text in red."""
-    return colored(text, "red")
+    return f"{RED}{text}{RESET}"
 
 
 def greenify(text: str):
     """Returns text in green."""
-    return colored(text, "green")
+    return f"{GREEN}{text}{RESET}"
 
 
 def blueify(text: str):
     """Returns text in blue."""
-    return colored(text, "blue")
+    return f"{BLUE}{text}{RESET}"
 
 
 def magentify(text: str):
     """Returns text in magenta."""
-    return colored(text, "magenta")
+    return f"{MAGENTA}{text}{RESET}"
 
 
 def cyanify(text: str):
     """Returns text in cyan."""
-    return colored(text, "cyan")
+    return f"{CYAN}{text}{RESET}"
 
 
 def yellowify(text: str):
     """Returns text in yellow."""
-    return colored(text, "yellow")
+    return f"{YELLOW}{text}{RESET}"
 
 
 def boldify(text: str):
     """Returns text in bold."""
-    return colored(text, attrs=["bold"])
+    return f"{BOLD}{text}{RESET}"
 
 
 def underlinify(text: str):
     """Returns text in underlined."""
-    return colored(text, attrs=["underline"])
-
-
-def normalify(text: str):
-    """Returns text in normal font."""
-    return text[5:-4]
+    return f"{UNDERLINE}{text}{RESET}"
+
+
+# Pre-colored strings that are redrawn on every screen refresh
+TTT_LOGO_COLORED = cyanify(TTT_LOGO)
+X_MARKER = blueify(boldify("X"))
+O_MARKER = redify(boldify("O"))
+ROUND_HEADER_FMT = boldify(underlinify("Game Round #{}"))
+SCOREBOARD_HEADER = boldify(underlinify("Scoreboard"))
+RULES_TEXT = "\n".join(
+    (
+        greenify("1. Enter a number between 1-9 to mark a cell."),
+        greenify("2. The first player to mark 3 cells in a row wins!"),
+        greenify("3. The markers (X and O) are swapped every round."),
+        "4. Use `?stop` to return to the main menu at any time.",
+        "5. Use `?hint` if you're stuck and need a suggestion.",
+    )
+)
 
 
 def reset_data(specific_data: Literal["Leaderboard", "History"] = None):
     """Resets the data in the database."""
-    with dbopen(TTT_DB_PATH) as cursor:
+    with dbopen(TTT_DB_PATH, transaction=True) as cursor:
         if specific_data is None:
             query = "DELETE FROM scores"
             cursor.execute(query)
@@ -117,20 +292,86 @@ def reset_data(specific_data: Literal["Leaderboard", "History"] = None):
             raise ValueError("Invalid data type!")
 
 
+# Connections shared for the life of the process, keyed by database path
+_connections = {}
+
+# Statements run once on every newly opened connection
+DB_SETUP_QUERIES = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "CREATE INDEX IF NOT EXISTS idx_scores_score ON scores(score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_history_ts ON history(timestamp DESC)",
+)
+
+# Queries kept as constants so sqlite3's per-connection statement cache reuses them
+ADD_SCORE_QUERY = (
+    "INSERT INTO scores VALUES (?, 1) "
+    "ON CONFLICT(name) DO UPDATE SET score = score + 1"
+)
+SAVE_ROUND_QUERY = "INSERT INTO history VALUES (?, ?, ?, ?)"
+
+# Maximum number of rounds shown in Match History
+HISTORY_LIMIT = 100
+
+# Format of the "Played On" column in Match History
+HISTORY_TIME_FMT = "%b %d, %Y %I:%M %p"
+
+
+@functools.lru_cache(maxsize=4096)
+def format_played_on(minute: int):
+    """Returns the Match History date for a timestamp given in whole minutes."""
+    return time.strftime(HISTORY_TIME_FMT, time.localtime(minute * 60))
+
+
 class dbopen:
-    """A context manager for sqlite3 connections."""
+    """A context manager for sqlite3 connections.
+
+    Connections are kept open and reused across calls, see `_connections`. When
+    `transaction` is set, the statements are wrapped in a single BEGIN/COMMIT.
+    """
 
-    def __init__(self, path):
+    def __init__(self, path, transaction: bool = False):
         self.path = path
+        self.transaction = transaction
 
     def __enter__(self):
-        self.conn = sql.connect(self.path)
+        if self.path not in _connections:
+            _connections[self.path] = open_connection(self.path)
+
+        self.conn = _connections[self.path]
         self.cursor = self.conn.cursor()
+
+        if self.transaction:
+            self.cursor.execute("BEGIN")
+
         return self.cursor
 
     def __exit__(self, exc_class, exc, traceback):
-        self.conn.commit()
-        self.conn.close()
+        if self.transaction:
+            self.cursor.execute("ROLLBACK" if exc_class else "COMMIT")
+
+        self.cursor.close()
+
+
+def open_connection(path):
+    """Opens an autocommit connection to the database and applies its settings."""
+    conn = sql.connect(path, isolation_level=None, check_same_thread=False)
+    for query in DB_SETUP_QUERIES:
+        conn.execute(query)
+
+    return conn
+
+
+def close_connections():
+    """Closes all the shared database connections."""
+    while _connections:
+        _, conn = _connections.popitem()
+        conn.close()
+
+
+# Whichever connections got opened are closed (and their WAL checkpointed) on exit
+atexit.register(close_connections)
 
 
 class Player:
@@ -139,91 +380,102 @@ class Player:
     def __init__(self, name: str, marker: str):
         self.name = name.title()
         self.marker = marker
-        self.moves = []
+        self.bits = 0  # Bitmask of the marked cells, cell N is bit N - 1
         self.score = 0
 
     def __str__(self):
-        return (
-            blueify(self.name)
-            if self.marker == blueify(boldify("X"))
-            else redify(self.name)
+        return self._colored_name
+
+    @property
+    def marker(self):
+        return self._marker
+
+    @marker.setter
+    def marker(self, marker: str):
+        # The colored name only changes when the markers are swapped
+        self._marker = marker
+        self._colored_name = (
+            blueify(self.name) if marker == X_MARKER else redify(self.name)
         )
 
     def add_move(self, move: int):
-        self.moves.append(move)
-        self.moves.sort()
+        self.bits |= 1 << (move - 1)
 
     def reset_moves(self):
-        self.moves = []
+        self.bits = 0
 
     def add_score(self):
-        self.score += 1
+        Player.add_scores([self])
 
-        with dbopen(TTT_DB_PATH) as cursor:
-            try:
-                query = "INSERT INTO scores VALUES (?, 1)"
-                cursor.execute(query, (self.name,))
-            except sql.IntegrityError:
-                query = "UPDATE scores SET score = score + 1 WHERE name = ?"
-                cursor.execute(query, (self.name,))
+    @staticmethod
+    def add_scores(players: list):
+        """Adds a point to each of the players in a single transaction."""
+        for player in players:
+            player.score += 1
+
+        with dbopen(TTT_DB_PATH, transaction=True) as cursor:
+            cursor.executemany(ADD_SCORE_QUERY, [(player.name,) for player in players])
 
 
 class Board:
     """Represents the game board."""
 
     def __init__(self):
-        self.board = {}
+        self._raw_table = [1, 2, 3, 4, 5, 6, 7, 8, 9]  # Marker or number per cell
+        self.bits = 0  # Bitmask of the occupied cells, cell N is bit N - 1
+        self._grid_cache = None
 
     def add_move(self, move: int, player: Player):
-        if move in self.board:
+        bit = 1 << (move - 1)
+        if self.bits & bit:
             return False  # The move already exists!
         else:
-            self.board[move] = player.marker
+            self._raw_table[move - 1] = player.marker
+            self.bits |= bit
             player.add_move(move)
 
             return True
 
     def is_full(self):
-        return len(self.board) == 9
+        return kernels()[1](self.bits)
 
-    def draw(self, round_num: int, winning_combo: tuple = None):
+    def render(self, round_num: int, winning_combo: tuple = None):
         if winning_combo and not len(winning_combo) == 3:
             raise ValueError("Winning combo must be a tuple of 3 values!")
 
-        raw_table = []
-        for i in range(1, 10):
-            if i in self.board:
-                raw_table.append(self.board[i])
-            else:
-                raw_table.append(i)
+        # Cells are only ever added, so the occupied cells identify the board state
+        key = (self.bits, winning_combo)
 
-        if winning_combo:
-            for index in winning_combo:
-                raw_table[index - 1] = greenify(normalify(raw_table[index - 1]))
+        if self._grid_cache is None or self._grid_cache[0] != key:
+            self._grid_cache = (key, self._render_grid(winning_combo))
 
-        table_data = []
+        return (
+            f"{ROUND_HEADER_FMT.format(round_num)}\n\n"
+            f"{RULES_TEXT}\n\n"
+            f"{self._grid_cache[1]}\n\n"
+        )
 
-        for i in range(0, len(raw_table), 3):
-            table_data.append(raw_table[i : i + 3])
+    def _render_grid(self, winning_combo: tuple = None):
+        from tabulate import tabulate
 
-        print(boldify(underlinify(f"Game Round #{round_num}")), end="\n\n")
+        raw_table = self._raw_table
 
-        print(
-            greenify("1. Enter a number between 1-9 to mark a cell."),
-            greenify("2. The first player to mark 3 cells in a row wins!"),
-            greenify("3. The markers (X and O) are swapped every round."),
-            "4. Use `?stop` to return to the main menu at any time.",
-            sep="\n",
-            end="\n\n",
-        )
+        if winning_combo:
+            # Only copy the cells when some of them need to be recolored
+            raw_table = raw_table.copy()
+            for index in winning_combo:
+                symbol = "X" if raw_table[index - 1] == X_MARKER else "O"
+                raw_table[index - 1] = greenify(boldify(symbol))
 
-        print(tabulate(table_data, tablefmt="fancy_grid"), end="\n\n")
+        table_data = [raw_table[0:3], raw_table[3:6], raw_table[6:9]]
+
+        return tabulate(table_data, tablefmt="fancy_grid")
 
     @staticmethod
     def check_winner(player: Player):
-        for combo in winning_combos:
-            if all(move in player.moves for move in combo):
-                return True, combo
+        mask = kernels()[0](player.bits)
+        if mask:
+            return True, MASK_TO_COMBO[mask]
 
         return False
 
@@ -236,24 +488,40 @@ class Game:
         self.players = []
         self.winner = None
         self.round_num = round_num
+        self._scoreboard_cache = None
 
-    def draw_scoreboard(self):
-        print(boldify(underlinify("Scoreboard")), end="\n\n")
-
+    def scoreboards(self):
+        """Returns the colored and uncolored scoreboard tables."""
         p1 = self.players[0]
         p2 = self.players[1]
 
-        names = [blueify(f"{p1.name} (X)"), redify(f"{p2.name} (O)")]
-        scores = [[str(p1.score), str(p2.score)]]
+        # The scoreboard is only re-rendered when a name or score changes
+        key = (p1.name, p1.score, p2.name, p2.score)
+
+        if self._scoreboard_cache is None or self._scoreboard_cache[0] != key:
+            from tabulate import tabulate
+
+            names = [f"{p1.name} (X)", f"{p2.name} (O)"]
+            colored_names = [blueify(names[0]), redify(names[1])]
+            scores = [[str(p1.score), str(p2.score)]]
 
-        colored_scoreboard = tabulate(scores, headers=names, tablefmt="pretty")
-        print(colored_scoreboard)
-        print(DIVIDER)
+            colored_scoreboard = tabulate(
+                scores, headers=colored_names, tablefmt="pretty"
+            )
+            uncolored_scoreboard = tabulate(scores, headers=names, tablefmt="pretty")
 
-        names = [f"{p1.name} (X)", f"{p2.name} (O)"]
-        uncolored_scoreboard = tabulate(scores, headers=names, tablefmt="pretty")
+            self._scoreboard_cache = (key, colored_scoreboard, uncolored_scoreboard)
 
-        return uncolored_scoreboard
+        return self._scoreboard_cache[1:]
+
+    def redraw(self, winning_combo: tuple = None):
+        """Redraws the scoreboard and the board in a single write and flush."""
+        colored_scoreboard, _ = self.scoreboards()
+
+        clear_screen(
+            f"{SCOREBOARD_HEADER}\n\n{colored_scoreboard}\n{DIVIDER}\n"
+            f"{self.board.render(self.round_num, winning_combo)}"
+        )
 
     def save(self):
         self.round_num += 1
@@ -263,19 +531,19 @@ class Game:
         p2_name = self.players[1].name
         winner = self.winner.name if self.winner else None
 
-        with dbopen(TTT_DB_PATH) as cursor:
-            query = "INSERT INTO history VALUES (?, ?, ?, ?)"
-            cursor.execute(query, (p1_name, p2_name, winner, timestamp))
+        with dbopen(TTT_DB_PATH, transaction=True) as cursor:
+            cursor.execute(SAVE_ROUND_QUERY, (p1_name, p2_name, winner, timestamp))
 
     def start(self):
-        players_iter = itertools.cycle(self.players)
+        players = tuple(self.players)
+        turn = 0
 
-        clear_screen()
-        self.draw_scoreboard()
-        self.board.draw(round_num=self.round_num)
+        self.redraw()
 
         while True:
-            cur_player = next(players_iter)
+            cur_player = players[turn]
+            turn ^= 1
+            opponent = players[turn]
 
             while True:
                 move = input(
@@ -285,26 +553,22 @@ class Game:
                 if move.lower() == "?stop":
                     return
 
-                if (
-                    move.isdigit()
-                    and 1 <= int(move) <= 9
-                    and self.board.add_move(int(move), cur_player)
-                ):
+                if move.lower() == "?hint":
+                    cell = best_move(cur_player.bits, opponent.bits)
+                    print(yellowify(f"Host: Psst... try marking cell {cell}!"))
+                    continue
+
+                cell = MOVE_MAP.get(move.strip())
+                if cell is not None and self.board.add_move(cell, cur_player):
                     break
                 else:
                     print(redify("That is not a valid move!"))
 
-            clear_screen()
-            self.draw_scoreboard()
-            self.board.draw(round_num=self.round_num)
-
             winner = self.board.check_winner(cur_player)
             if winner:
                 cur_player.add_score()
 
-                clear_screen()
-                self.draw_scoreboard()
-                self.board.draw(round_num=self.round_num, winning_combo=winner[1])
+                self.redraw(winning_combo=winner[1])
 
                 print(greenify(f"{cur_player} has won! GGs!"), end="\n\n")
                 self.winner = cur_player
@@ -316,12 +580,9 @@ class Game:
                 break
 
             if self.board.is_full():
-                for player in self.players:
-                    player.add_score()
+                Player.add_scores(self.players)
 
-                clear_screen()
-                self.draw_scoreboard()
-                self.board.draw(round_num=self.round_num)
+                self.redraw()
 
                 print(greenify("It's a draw! GGs!"), end="\n\n")
 
@@ -331,7 +592,11 @@ class Game:
 
                 break
 
-        scoreboard = self.draw_scoreboard()
+            self.redraw()
+
+        import pick
+
+        _, scoreboard = self.scoreboards()
         text = f"{TTT_LOGO}{scoreboard}\n\nUp for a rematch?"
         options = ["Bring it!", "Nop, I'm out!"]
         _, index = pick.pick(options, text, indicator=" → ", default_index=0)
@@ -344,9 +609,7 @@ class Game:
             for index, player in enumerate(self.players[::-1]):
                 
                 player.reset_moves()
-                player.marker = (
-                    blueify(boldify("X")) if index == 0 else redify(boldify("O"))
-                )
+                player.marker = X_MARKER if index == 0 else O_MARKER
 
                 game.players.append(player)
 
@@ -354,6 +617,8 @@ class Game:
 
 
 def main():
+    import pick
+
     while True:
         # Displaying the main menu screen!
         about_text = (
@@ -384,52 +649,51 @@ def main():
 
         if index == 1:
             with dbopen(TTT_DB_PATH) as cursor:
-                query = "SELECT * FROM history"
-                cursor.execute(query)
+                query = "SELECT * FROM history ORDER BY timestamp DESC LIMIT ?"
+                cursor.execute(query, (HISTORY_LIMIT,))
                 history = cursor.fetchall()
 
-                print(boldify(underlinify("Match History")), end="\n\n")
+            # The whole screen is buffered and written out in a single call
+            parts = [boldify(underlinify("Match History")), ""]
 
-                if not history:
-                    print(
-                        yellowify(
-                            "All the rounds you play will be logged here "
-                            "in Match History! Game on!"
-                        ),
-                        end="\n\n",
+            if not history:
+                parts.append(
+                    yellowify(
+                        "All the rounds you play will be logged here "
+                        "in Match History! Game on!"
                     )
+                )
 
-                else:
-                    headers = ["Played On", "Player 1", "Player 2", "Winner"]
-                    table_data = []
-                    for row in history:
-                        timestamp = time.strftime(
-                            "%b %d, %Y %I:%M %p", time.localtime(row[3])
-                        )
-
-                        player1 = blueify(row[0])
-                        player2 = redify(row[1])
-
-                        winner = greenify("Draw") if row[2] is None else row[2]
+            else:
+                headers = ["Played On", "Player 1", "Player 2", "Winner"]
+                table_data = []
+                for player1, player2, winner, timestamp in history:
+                    if winner is None:
+                        winner = greenify("Draw")
+                    elif winner == player1:
+                        winner = blueify(winner)
+                    else:
+                        winner = redify(winner)
+
+                    # Rounds played within the same minute share a cached date
+                    played_on = format_played_on(timestamp // 60)
+                    table_data.append(
+                        [played_on, blueify(player1), redify(player2), winner]
+                    )
 
-                        if not winner == "Draw":
-                            winner = (
-                                blueify(winner) if winner == row[0] else redify(winner)
-                            )
+                from tabulate import tabulate
 
-                        table_data.append([timestamp, player1, player2, winner])
+                parts.append(tabulate(table_data, headers=headers, tablefmt="pretty"))
 
-                    print(
-                        tabulate(table_data, headers=headers, tablefmt="pretty"),
-                        end="\n\n",
-                    )
+            sys.stdout.write("\n".join(parts) + "\n\n")
+            sys.stdout.flush()
 
-                input("Press Enter key to continue...")
-                print(greenify("Returning to the main menu..."))
+            input("Press Enter key to continue...")
+            print(greenify("Returning to the main menu..."))
 
-                time.sleep(0.5)
+            time.sleep(0.5)
 
-                continue
+            continue
 
         elif index == 2:
             with dbopen(TTT_DB_PATH) as cursor:
@@ -457,6 +721,8 @@ def main():
 
                     table_data.append([name, score])
 
+                from tabulate import tabulate
+
                 print(
                     tabulate(table_data, headers=headers, tablefmt="pretty"), end="\n\n"
                 )
@@ -549,8 +815,8 @@ def main():
         name1 = name1 if name1 else "Player 1"
         name2 = name2 if name2 else "Player 2"
 
-        player1 = Player(name1, blueify(boldify("X")))
-        player2 = Player(name2, redify(boldify("O")))
+        player1 = Player(name1, X_MARKER)
+        player2 = Player(name2, O_MARKER)
 
         game = Game()
         game.players = [player1, player2]
@@ -564,6 +830,14 @@ def main():
 
 
 if __name__ == "__main__":
+    # Opening the game's database once at startup, instead of on the first query
+    _connections[TTT_DB_PATH] = open_connection(TTT_DB_PATH)
+
+    # Importing Numba and compiling (or loading) the kernels takes a few hundred
+    # milliseconds, so it's done here rather than stalling the first move
+    for kernel in kernels():
+        kernel(0)
+
     try:
         main()
     except KeyboardInterrupt: